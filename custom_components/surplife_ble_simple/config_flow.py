@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from typing import Any
 
@@ -9,13 +11,16 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.components import bluetooth
-
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import DOMAIN, SERVICE_UUID
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long to wait for a matching advertisement when none is known yet
+DISCOVERY_TIMEOUT = 3.0
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Surplife BLE Simple."""
@@ -24,7 +29,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._discovered_devices: dict[str, bluetooth.BluetoothServiceInfoBleak] = {}
+        # Only the name is needed downstream, so avoid holding full adverts
+        self._discovered_devices: dict[str, str] = {}
+        self._schema_cache: tuple[frozenset[str], vol.Schema] | None = None
+        self._current_addresses: frozenset[str] = frozenset()
+        self._new_device_event = asyncio.Event()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -34,53 +43,110 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             address = user_input["address"]
-            discovery_info = self._discovered_devices.get(address)
-            if discovery_info:
+            name = self._discovered_devices.get(address)
+            if name:
                 await self.async_set_unique_id(address, raise_on_progress=False)
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(
-                    title=discovery_info.name,
+                    title=name,
                     data={"address": address},
                 )
             errors["base"] = "cannot_connect"
 
-        # Scan for devices with specific UUID
-        current_addresses = self._async_current_ids()
-        for discovery_info in bluetooth.async_discovered_service_info(self.hass):
-            # Debug: Log ALL discovered devices to help identify the Surplife device
-            _LOGGER.debug(
-                "Discovered BLE device: name=%s, address=%s, service_uuids=%s, manufacturer_data=%s",
-                discovery_info.name,
-                discovery_info.address,
-                discovery_info.service_uuids,
-                discovery_info.manufacturer_data,
-            )
-
-            # Case-insensitive UUID matching
-            service_uuids_lower = [
-                uuid.lower() for uuid in discovery_info.service_uuids
-            ]
-            if (
-                SERVICE_UUID.lower() in service_uuids_lower
-                and discovery_info.address not in current_addresses
-            ):
-                _LOGGER.debug("Found matching Surplife device: %s", discovery_info.name)
-                self._discovered_devices[discovery_info.address] = discovery_info
+        # Only scan on the first render; re-renders after an error reuse the list
+        if not self._discovered_devices:
+            await self._async_discover_devices()
 
         if not self._discovered_devices:
             return self.async_abort(reason="no_devices_found")
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("address"): vol.In(
-                        {
-                            address: f"{info.name} ({address})"
-                            for address, info in self._discovered_devices.items()
-                        }
-                    )
-                }
-            ),
+            data_schema=self._async_get_schema(),
             errors=errors,
         )
+
+    async def _async_discover_devices(self) -> None:
+        """Collect devices advertising the Surplife service UUID."""
+        self._current_addresses = frozenset(self._async_current_ids())
+        # Home Assistant filters adverts by the matcher and replays any matching
+        # history immediately, so no iteration over every known advert is needed
+        cancel = bluetooth.async_register_callback(
+            self.hass,
+            self._async_on_advertisement,
+            bluetooth.BluetoothCallbackMatcher(
+                service_uuid=SERVICE_UUID, connectable=True
+            ),
+            bluetooth.BluetoothScanningMode.ACTIVE,
+        )
+        try:
+            if not self._discovered_devices:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._new_device_event.wait(), timeout=DISCOVERY_TIMEOUT
+                    )
+        finally:
+            cancel()
+
+        if not self._discovered_devices:
+            self._async_scan_discovered_service_info()
+
+    @callback
+    def _async_scan_discovered_service_info(self) -> None:
+        """Fall back to a full scan when the matcher found no device."""
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        for discovery_info in bluetooth.async_discovered_service_info(self.hass):
+            # Debug: Log ALL discovered devices to help identify the Surplife device
+            if debug:
+                _LOGGER.debug(
+                    "Discovered BLE device: name=%s, address=%s, service_uuids=%s, manufacturer_data=%s",
+                    discovery_info.name,
+                    discovery_info.address,
+                    discovery_info.service_uuids,
+                    discovery_info.manufacturer_data,
+                )
+
+            # The matcher compares exactly; accept devices with mis-cased UUIDs
+            if any(
+                uuid.lower() == SERVICE_UUID for uuid in discovery_info.service_uuids
+            ):
+                self._async_on_advertisement(
+                    discovery_info, bluetooth.BluetoothChange.ADVERTISEMENT
+                )
+
+    @callback
+    def _async_on_advertisement(
+        self,
+        discovery_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Record a matching Surplife device."""
+        address = discovery_info.address
+        if address in self._current_addresses or address in self._discovered_devices:
+            return
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Found matching Surplife device: name=%s, address=%s, "
+                "manufacturer_data=%s",
+                discovery_info.name,
+                address,
+                discovery_info.manufacturer_data,
+            )
+        self._discovered_devices[address] = discovery_info.name
+        self._new_device_event.set()
+
+    def _async_get_schema(self) -> vol.Schema:
+        """Return the device picker schema, reusing it if devices are unchanged."""
+        key = frozenset(self._discovered_devices)
+        if self._schema_cache is not None and self._schema_cache[0] == key:
+            return self._schema_cache[1]
+
+        # Labels are formatted once per device set and owned by the cached schema
+        labels = {
+            address: f"{name} ({address})"
+            for address, name in self._discovered_devices.items()
+        }
+        schema = vol.Schema({vol.Required("address"): vol.In(labels)})
+        self._schema_cache = (key, schema)
+        return schema
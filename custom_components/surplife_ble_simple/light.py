@@ -38,6 +38,14 @@ _LOGGER = logging.getLogger(__name__)
 # Reconnection delay in seconds
 RECONNECT_DELAY = 5.0
 
+# Constant part of the RGB packet checksum
+HEADER_RGB_SUM = sum(HEADER_RGB)
+
+# Skip ATT write acks for light commands. Only on/off is confirmed by a status
+# notification; a dropped RGB write is not reported. The initial poke still
+# uses a write request.
+WRITE_RESPONSE = False
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -81,7 +89,12 @@ class SurplifeBLELight(LightEntity):
         self._client: BleakClient | None = None
         self._reconnect_task: asyncio.Task | None = None
         self._connect_task: asyncio.Task | None = None
+        # Serializes connects from setup, reconnect tasks and command sends
+        self._connect_lock = asyncio.Lock()
         self._shutting_down = False
+        # Reusable RGB packet buffer: header, 8 payload bytes and the checksum
+        self._rgb_buf = bytearray(12)
+        self._rgb_buf[:3] = HEADER_RGB
 
     @property
     def assumed_state(self) -> bool:
@@ -120,43 +133,48 @@ class SurplifeBLELight(LightEntity):
 
     async def _async_connect(self) -> None:
         """Establish connection and subscribe to notifications."""
-        if self._shutting_down:
-            return
+        async with self._connect_lock:
+            if self._shutting_down:
+                return
+            if self._client and self._client.is_connected:
+                return  # Another caller connected while we waited for the lock
 
-        # Get the latest BLE device reference
-        ble_device = bluetooth.async_ble_device_from_address(self.hass, self._address)
-        if not ble_device:
-            _LOGGER.warning("Device %s not found, scheduling reconnect", self._address)
-            self._schedule_reconnect()
-            return
+            try:
+                _LOGGER.debug("Connecting to %s", self._address)
+                self._client = await establish_connection(
+                    BleakClient,
+                    self._ble_device,
+                    self._address,
+                    disconnected_callback=self._on_disconnect,
+                    use_services_cache=True,
+                    ble_device_callback=self._get_ble_device,
+                )
+                _LOGGER.info("Connected to %s", self._address)
 
-        try:
-            _LOGGER.debug("Connecting to %s", self._address)
-            self._client = await establish_connection(
-                BleakClient,
-                ble_device,
-                self._address,
-                disconnected_callback=self._on_disconnect,
-            )
-            _LOGGER.info("Connected to %s", self._address)
+                # Subscribe to notifications
+                await self._client.start_notify(NOTIFY_UUID, self._handle_notification)
+                _LOGGER.debug("Subscribed to notifications on %s", NOTIFY_UUID)
 
-            # Subscribe to notifications
-            await self._client.start_notify(NOTIFY_UUID, self._handle_notification)
-            _LOGGER.debug("Subscribed to notifications on %s", NOTIFY_UUID)
+                # Send poke command to get initial state
+                await self._client.write_gatt_char(
+                    WRITE_UUID, POKE_COMMAND, response=True
+                )
+                _LOGGER.debug("Sent poke command to get initial state")
 
-            # Send poke command to get initial state
-            await self._client.write_gatt_char(
-                WRITE_UUID, bytearray(POKE_COMMAND), response=True
-            )
-            _LOGGER.debug("Sent poke command to get initial state")
+                # Update availability
+                self.async_write_ha_state()
 
-            # Update availability
-            self.async_write_ha_state()
+            except BleakError as e:
+                _LOGGER.error("Failed to connect to %s: %s", self._address, e)
+                self._client = None
+                self._schedule_reconnect()
 
-        except BleakError as e:
-            _LOGGER.error("Failed to connect to %s: %s", self._address, e)
-            self._client = None
-            self._schedule_reconnect()
+    def _get_ble_device(self) -> BLEDevice:
+        """Return the latest BLE device, falling back to the last known one."""
+        ble_device = bluetooth.async_ble_device_from_address(self.hass, self._address)
+        if ble_device:
+            self._ble_device = ble_device
+        return self._ble_device
 
     async def _async_disconnect(self) -> None:
         """Disconnect from the device."""
@@ -175,6 +193,8 @@ class SurplifeBLELight(LightEntity):
     @callback
     def _on_disconnect(self, client: BleakClient) -> None:
         """Handle disconnection callback."""
+        if client is not self._client:
+            return  # A client we already replaced or dropped
         _LOGGER.warning("Disconnected from %s", self._address)
         self._client = None
         self.async_write_ha_state()
@@ -200,21 +220,24 @@ class SurplifeBLELight(LightEntity):
         self, sender: BleakGATTCharacteristic, data: bytearray
     ) -> None:
         """Handle incoming BLE notifications."""
-        _LOGGER.debug("Received notification: %s", data.hex())
-
-        # Parse status packets starting with 0xA1
-        if len(data) >= 4 and data[0] == 0xA1:
-            # Check for state packet (data[2] == 0x66 or similar patterns)
-            if data[2] == 0x66:
-                new_state = data[3] == 0x01
-                if self._is_on != new_state:
-                    self._is_on = new_state
-                    _LOGGER.info(
-                        "Device %s state updated: %s",
-                        self._address,
-                        "ON" if new_state else "OFF",
-                    )
-                    self.async_write_ha_state()
+        # Only state packets (0xA1 status with data[2] == 0x66) are of interest
+        if len(data) < 4 or data[0] != 0xA1 or data[2] != 0x66:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Ignored notification: %s", data.hex())
+            return
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received notification: %s", data.hex())
+
+        new_state = data[3] == 0x01
+        if self._is_on != new_state:
+            self._is_on = new_state
+            _LOGGER.info(
+                "Device %s state updated: %s",
+                self._address,
+                "ON" if new_state else "OFF",
+            )
+            self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
@@ -242,51 +265,59 @@ class SurplifeBLELight(LightEntity):
             self._is_on = False
             self.async_write_ha_state()
 
-    def _calculate_checksum(self, packet: list[int]) -> int:
-        """Calculate checksum: Sum of bytes masked to 0xFF."""
-        return sum(packet) & 0xFF
-
     async def _send_rgb_command(self, rgb: tuple[int, int, int]) -> None:
         """Send RGB command."""
         # Generic RGB packet structure:
         # Header: [0xA0, 0x04, 0x1A]
         # Payload: [Red, Green, Blue, 0x00, 0x00, 0x00, 0x00, 0x00] (8 bytes)
-        # Checksum: Calculate sum of Header + Payload.
+        # Checksum: Sum of Header + Payload masked to 0xFF.
         r, g, b = rgb
-        packet = HEADER_RGB + [r, g, b, 0x00, 0x00, 0x00, 0x00, 0x00]
-        checksum = self._calculate_checksum(packet)
-        packet.append(checksum)
+        packet = self._rgb_buf
+        packet[3] = r
+        packet[4] = g
+        packet[5] = b
+        # Zero padding adds nothing, so only the header and RGB are summed
+        packet[11] = (HEADER_RGB_SUM + r + g + b) & 0xFF
         await self._send_command_raw(packet)
 
-    async def _send_command_raw(self, packet: list[int]) -> None:
+    async def _send_command_raw(self, packet: bytes | bytearray) -> None:
         """Send raw command to device using persistent connection."""
-        if self._client and self._client.is_connected:
+        last_error: BleakError | None = None
+        for attempt in range(2):
+            if not (self._client and self._client.is_connected):
+                # Not connected, try to connect first then send
+                _LOGGER.warning(
+                    "Not connected to %s, attempting to connect and send", self._address
+                )
+                await self._async_connect()
+                if not (self._client and self._client.is_connected):
+                    # The connect failed and has scheduled a reconnect itself
+                    break
             try:
                 await self._client.write_gatt_char(
-                    WRITE_UUID, bytearray(packet), response=True
+                    WRITE_UUID, packet, response=WRITE_RESPONSE
                 )
-                _LOGGER.debug("Sent command: %s", bytes(packet).hex())
             except BleakError as e:
-                _LOGGER.error("Failed to send command to %s: %s", self._address, e)
-                # Connection may have dropped, trigger reconnect
-                self._on_disconnect(self._client)
-        else:
-            # Not connected, try to connect first then send
-            _LOGGER.warning(
-                "Not connected to %s, attempting to connect and send", self._address
-            )
-            await self._async_connect()
-            if self._client and self._client.is_connected:
+                last_error = e
+                _LOGGER.debug(
+                    "Write attempt %d to %s failed: %s", attempt, self._address, e
+                )
+                # Drop and close the failed client before retrying on a new one
+                failed = self._client
+                self._client = None
+                self.async_write_ha_state()
                 try:
-                    await self._client.write_gatt_char(
-                        WRITE_UUID, bytearray(packet), response=True
-                    )
-                    _LOGGER.debug(
-                        "Sent command after reconnect: %s", bytes(packet).hex()
-                    )
-                except BleakError as e:
-                    _LOGGER.error(
-                        "Failed to send command to %s after reconnect: %s",
-                        self._address,
-                        e,
-                    )
+                    await failed.disconnect()
+                except BleakError:
+                    pass  # Ignore disconnect errors
+                continue
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Sent command: %s", packet.hex())
+            return
+        if self._client is None:
+            self._schedule_reconnect()
+        _LOGGER.error(
+            "Failed to send command to %s: %s",
+            self._address,
+            last_error or "not connected",
+        )